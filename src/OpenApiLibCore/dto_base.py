@@ -9,8 +9,9 @@ from copy import deepcopy
 from dataclasses import dataclass, fields
 from logging import getLogger
 from random import choice, shuffle
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 from uuid import uuid4
+from weakref import WeakKeyDictionary
 
 from OpenApiLibCore import value_utils
 
@@ -19,6 +20,13 @@ logger = getLogger(__name__)
 NOT_SET = object()
 SENTINEL = object()
 
+# Cache of the (field name, original property name) pairs per Dto class, so
+# as_dict does not have to inspect the dataclass fields on every call. Weak
+# keys are used since Dto classes can be created dynamically per request.
+_FIELD_NAMES_BY_CLASS: "WeakKeyDictionary[type, Tuple[Tuple[str, str], ...]]" = (
+    WeakKeyDictionary()
+)
+
 
 def resolve_schema(schema: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -107,7 +115,8 @@ class PropertyValueConstraint(ResourceRelation):
     """The allowed values for property_name."""
 
     property_name: str
-    values: List[Any]
+    # any sequence will do; an (immutable) tuple can be shared between instances
+    values: Sequence[Any]
     invalid_value: Any = NOT_SET
     invalid_value_error_code: int = 422
     error_code: int = 422
@@ -150,10 +159,31 @@ Relation = Union[
 ]
 
 
+def relations_for_error_code(
+    relations: List[Relation], error_code: int
+) -> List[Relation]:
+    """Return the Relations from `relations` associated with the given error_code."""
+    return [
+        r
+        for r in relations
+        if r.error_code == error_code
+        or (
+            getattr(r, "invalid_value_error_code", None) == error_code
+            and getattr(r, "invalid_value", None) != NOT_SET
+        )
+    ]
+
+
 @dataclass
 class Dto(ABC):
     """Base class for the Dto class."""
 
+    # NOTE: the base itself defines no fields, so it does not need a __dict__.
+    # The subclasses cannot use frozen or slotted dataclasses: make_dataclass
+    # derives mutable classes with fields from them at runtime and as_dict
+    # reads the instance __dict__.
+    __slots__ = ()
+
     @staticmethod
     def get_parameter_relations() -> List[Relation]:
         """Return the list of Relations for the header and query parameters."""
@@ -161,16 +191,7 @@ class Dto(ABC):
 
     def get_parameter_relations_for_error_code(self, error_code: int) -> List[Relation]:
         """Return the list of Relations associated with the given error_code."""
-        relations: List[Relation] = [
-            r
-            for r in self.get_parameter_relations()
-            if r.error_code == error_code
-            or (
-                getattr(r, "invalid_value_error_code", None) == error_code
-                and getattr(r, "invalid_value", None) != NOT_SET
-            )
-        ]
-        return relations
+        return relations_for_error_code(self.get_parameter_relations(), error_code)
 
     @staticmethod
     def get_relations() -> List[Relation]:
@@ -179,16 +200,7 @@ class Dto(ABC):
 
     def get_relations_for_error_code(self, error_code: int) -> List[Relation]:
         """Return the list of Relations associated with the given error_code."""
-        relations: List[Relation] = [
-            r
-            for r in self.get_relations()
-            if r.error_code == error_code
-            or (
-                getattr(r, "invalid_value_error_code", None) == error_code
-                and getattr(r, "invalid_value", None) != NOT_SET
-            )
-        ]
-        return relations
+        return relations_for_error_code(self.get_relations(), error_code)
 
     def get_invalidated_data(
         self,
@@ -302,13 +314,20 @@ class Dto(ABC):
 
     def as_dict(self) -> Dict[Any, Any]:
         """Return the dict representation of the Dto."""
-        result = {}
+        cls = type(self)
+        field_names = _FIELD_NAMES_BY_CLASS.get(cls)
+        if field_names is None:
+            field_names = tuple(
+                (field.name, field.metadata["original_property_name"])
+                for field in fields(self)
+            )
+            _FIELD_NAMES_BY_CLASS[cls] = field_names
 
-        for field in fields(self):
-            field_name = field.name
-            if field_name not in self.__dict__:
+        result = {}
+        instance_dict = self.__dict__
+        for field_name, original_name in field_names:
+            if field_name not in instance_dict:
                 continue
-            original_name = field.metadata["original_property_name"]
-            result[original_name] = getattr(self, field_name)
+            result[original_name] = instance_dict[field_name]
 
         return result
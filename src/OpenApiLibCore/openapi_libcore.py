@@ -119,16 +119,18 @@ data types and properties. The following list details the most important ones:
 """
 
 import json as _json
+import re
 import sys
 from copy import deepcopy
 from dataclasses import Field, dataclass, field, make_dataclass
 from functools import cached_property
 from itertools import zip_longest
 from logging import getLogger
+from os import urandom
 from pathlib import Path
 from random import choice
-from typing import Any, Dict, List, Optional, Set, Tuple, Type, Union
-from uuid import uuid4
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Set, Tuple, Type, Union
 
 from openapi_core import Spec, validate_response
 from openapi_core.contrib.requests import (
@@ -143,6 +145,12 @@ from requests.cookies import RequestsCookieJar as CookieJar
 from robot.api.deco import keyword, library
 from robot.libraries.BuiltIn import BuiltIn
 
+try:
+    # orjson is an optional dependency that speeds up request body serialization
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
 from OpenApiLibCore import value_utils
 from OpenApiLibCore.dto_base import (
     NOT_SET,
@@ -153,6 +161,7 @@ from OpenApiLibCore.dto_base import (
     PropertyValueConstraint,
     Relation,
     UniquePropertyValueConstraint,
+    relations_for_error_code,
     resolve_schema,
 )
 from OpenApiLibCore.dto_utils import (
@@ -181,6 +190,27 @@ def get_safe_key(key: str) -> str:
     return key
 
 
+# matches a path parameter, e.g. the {employee_id} part of /employees/{employee_id}
+_PARAM_RE = re.compile(r"\{[^/}]+\}")
+
+_RANDOM_HEX_POOL: List[str] = []
+
+
+def _random_uuid_hex() -> str:
+    """
+    Return a random 32-character hex string equivalent to uuid4().hex.
+
+    The randomness is read from os.urandom in batches so that suites that
+    invalidate many urls do not perform a syscall for every generated id.
+    """
+    if not _RANDOM_HEX_POOL:
+        buffer = urandom(16 * 256)
+        _RANDOM_HEX_POOL.extend(
+            buffer[index : index + 16].hex() for index in range(0, len(buffer), 16)
+        )
+    return _RANDOM_HEX_POOL.pop()
+
+
 @dataclass
 class RequestValues:
     """Helper class to hold parameter values needed to make a request."""
@@ -192,22 +222,28 @@ class RequestValues:
     json_data: Optional[Dict[str, Any]]
 
 
-@dataclass
+@dataclass(frozen=True)
 class RequestData:
-    """Helper class to manage parameters used when making requests."""
+    """
+    Helper class to manage parameters used when making requests.
+
+    The class is immutable: `params` and `headers` are exposed as read-only
+    mappings. Code that needs an independent, mutable version can simply
+    construct one via e.g. `dict(request_data.params)`.
+    """
 
     dto: Union[Dto, DefaultDto] = field(default_factory=DefaultDto)
     dto_schema: Dict[str, Any] = field(default_factory=dict)
     parameters: List[Dict[str, Any]] = field(default_factory=list)
-    params: Dict[str, Any] = field(default_factory=dict)
-    headers: Dict[str, Any] = field(default_factory=dict)
+    params: Mapping[str, Any] = field(default_factory=dict)
+    headers: Mapping[str, Any] = field(default_factory=dict)
 
     def __post_init__(self) -> None:
         # prevent modification by reference
-        self.dto_schema = deepcopy(self.dto_schema)
-        self.parameters = deepcopy(self.parameters)
-        self.params = deepcopy(self.params)
-        self.headers = deepcopy(self.headers)
+        object.__setattr__(self, "dto_schema", deepcopy(self.dto_schema))
+        object.__setattr__(self, "parameters", deepcopy(self.parameters))
+        object.__setattr__(self, "params", MappingProxyType(dict(self.params)))
+        object.__setattr__(self, "headers", MappingProxyType(dict(self.headers)))
 
     @property
     def has_optional_properties(self) -> bool:
@@ -551,6 +587,14 @@ class OpenApiLibCore:  # pylint: disable=too-many-instance-attributes
         self.cert = cert
         self.verify = verify_tls
         self.extra_headers = extra_headers
+        # the headers that are added to every request are fixed after init, so
+        # merge them once; per-request headers are layered underneath on use
+        base_headers: Dict[str, str] = {}
+        if extra_headers:
+            base_headers.update(extra_headers)
+        if security_token and not self.auth:
+            base_headers["Authorization"] = security_token
+        self._base_headers = {k: str(v) for k, v in base_headers.items()}
         self.cookies = cookies
         self.proxies = proxies
         self.invalid_property_default_response = invalid_property_default_response
@@ -630,7 +674,7 @@ class OpenApiLibCore:  # pylint: disable=too-many-instance-attributes
             return url
         endpoint_parts = list(endpoint.split("/"))
         for index, part in enumerate(endpoint_parts):
-            if part.startswith("{") and part.endswith("}"):
+            if _PARAM_RE.fullmatch(part):
                 type_endpoint_parts = endpoint_parts[slice(index)]
                 type_endpoint = "/".join(type_endpoint_parts)
                 existing_id: Union[str, int, float] = run_keyword(
@@ -1001,14 +1045,16 @@ class OpenApiLibCore:  # pylint: disable=too-many-instance-attributes
             if len(id_get_paths) == 1:
                 id_get_path, _ = id_get_paths.pop()
             else:
-                try:
-                    [id_get_path] = [
+                id_get_path = next(
+                    (
                         path
                         for path, operation in id_get_paths
                         if operation == operation_id
-                    ]
+                    ),
+                    None,
+                )
                 # There could be multiple get_paths, but not one for the current operation
-                except ValueError:
+                if id_get_path is None:
                     return None
             valid_id = self.get_valid_id_for_endpoint(
                 endpoint=id_get_path, method="get"
@@ -1068,15 +1114,12 @@ class OpenApiLibCore:  # pylint: disable=too-many-instance-attributes
         Raises ValueError if the valid_url cannot be invalidated.
         """
         parameterized_endpoint = self.get_parameterized_endpoint_from_url(valid_url)
-        parameterized_url = self.base_url + parameterized_endpoint
-        valid_url_parts = list(reversed(valid_url.split("/")))
-        parameterized_parts = reversed(parameterized_url.split("/"))
-        for index, (parameterized_part, _) in enumerate(
-            zip(parameterized_parts, valid_url_parts)
-        ):
-            if parameterized_part.startswith("{") and parameterized_part.endswith("}"):
-                valid_url_parts[index] = uuid4().hex
-                valid_url_parts.reverse()
+        parameterized_parts = (self.base_url + parameterized_endpoint).split("/")
+        valid_url_parts = valid_url.split("/")
+        # replace the first path parameter, counted from the right
+        for index in range(1, min(len(parameterized_parts), len(valid_url_parts)) + 1):
+            if _PARAM_RE.fullmatch(parameterized_parts[-index]):
+                valid_url_parts[-index] = _random_uuid_hex()
                 invalid_url = "/".join(valid_url_parts)
                 return invalid_url
         raise ValueError(f"{parameterized_endpoint} could not be invalidated.")
@@ -1151,11 +1194,60 @@ class OpenApiLibCore:  # pylint: disable=too-many-instance-attributes
         Returns a version of `params, headers` as present on `request_data` that has
         been modified to cause the provided `status_code`.
         """
+        # the request_data mappings are read-only, so a shallow copy suffices
+        params = dict(request_data.params)
+        headers = dict(request_data.headers)
+        return self._invalidate_parameters(
+            status_code=status_code,
+            request_data=request_data,
+            params=params,
+            headers=headers,
+        )
+
+    @keyword
+    def get_invalidated_parameters_batch(
+        self,
+        status_codes: List[int],
+        request_data: RequestData,
+    ) -> List[Tuple[Dict[str, Any], Dict[str, str]]]:
+        """
+        Returns a list with an invalidated `params, headers` tuple for each of the
+        provided `status_codes`.
+
+        Invalidating multiple status_codes for the same `request_data` in one call
+        is cheaper than calling `Get Invalidated Parameters` for each status_code
+        separately: the parameter relations on the dto are gathered once and
+        shared between the invalidations.
+        """
+        # gather the relations once; each status_code only filters them
+        parameter_relations = request_data.dto.get_parameter_relations()
+        return [
+            self._invalidate_parameters(
+                status_code=status_code,
+                request_data=request_data,
+                params=dict(request_data.params),
+                headers=dict(request_data.headers),
+                parameter_relations=parameter_relations,
+            )
+            for status_code in status_codes
+        ]
+
+    def _invalidate_parameters(
+        self,
+        status_code: int,
+        request_data: RequestData,
+        params: Dict[str, Any],
+        headers: Dict[str, str],
+        parameter_relations: Optional[List[Relation]] = None,
+    ) -> Tuple[Dict[str, Any], Dict[str, str]]:
+        """Invalidate the provided params / headers to cause the `status_code`."""
         if not request_data.parameters:
             raise ValueError("No params or headers to invalidate.")
 
         # ensure the status_code can be triggered
-        relations = request_data.dto.get_parameter_relations_for_error_code(status_code)
+        if parameter_relations is None:
+            parameter_relations = request_data.dto.get_parameter_relations()
+        relations = relations_for_error_code(parameter_relations, status_code)
         relations_for_status_code = [
             r
             for r in relations
@@ -1176,10 +1268,6 @@ class OpenApiLibCore:  # pylint: disable=too-many-instance-attributes
                     f"No relations to cause status_code {status_code} found."
                 )
 
-        # ensure we're not modifying mutable properties
-        params = deepcopy(request_data.params)
-        headers = deepcopy(request_data.headers)
-
         if status_code == self.invalid_property_default_response:
             # take the params and headers that can be invalidated based on data type
             # and expand the set with properties that can be invalided by relations
@@ -1214,41 +1302,44 @@ class OpenApiLibCore:  # pylint: disable=too-many-instance-attributes
                 f"No parameter can be changed to cause status_code {status_code}."
             )
 
-        parameter_names = parameter_names - parameters_to_ignore
-        parameter_to_invalidate = choice(tuple(parameter_names))
+        # choice() cannot pick from a set, so materialize the eligible names
+        eligible_parameter_names = list(parameter_names - parameters_to_ignore)
+        parameter_to_invalidate = choice(eligible_parameter_names)
 
         # check for invalid parameters in the provided request_data
-        try:
-            [parameter_data] = [
+        parameter_data = next(
+            (
                 data
                 for data in request_data.parameters
                 if data["name"] == parameter_to_invalidate
-            ]
-        except Exception:
+            ),
+            None,
+        )
+        if parameter_data is None:
             raise ValueError(
                 f"{parameter_to_invalidate} not found in provided parameters."
-            ) from None
+            )
 
         # get the invalid_value for the chosen parameter
-        try:
-            [invalid_value_for_error_code] = [
+        invalid_value_for_error_code = next(
+            (
                 r.invalid_value
                 for r in relations_for_status_code
                 if r.property_name == parameter_to_invalidate
                 and r.invalid_value_error_code == status_code
-            ]
-        except ValueError:
-            invalid_value_for_error_code = NOT_SET
+            ),
+            NOT_SET,
+        )
 
         # get the constraint values if available for the chosen parameter
-        try:
-            [values_from_constraint] = [
+        values_from_constraint = next(
+            (
                 r.values
                 for r in relations_for_status_code
                 if r.property_name == parameter_to_invalidate
-            ]
-        except ValueError:
-            values_from_constraint = []
+            ),
+            [],
+        )
 
         # if the parameter was not provided, add it to params / headers
         params, headers = self.ensure_parameter_in_parameters(
@@ -1295,25 +1386,17 @@ class OpenApiLibCore:  # pylint: disable=too-many-instance-attributes
         Returns the params, headers tuple with parameter_to_invalidate with a valid
         value to params or headers if not originally present.
         """
-        if (
-            parameter_to_invalidate not in params.keys()
-            and parameter_to_invalidate not in headers.keys()
-        ):
-            if values_from_constraint:
-                valid_value = choice(values_from_constraint)
-            else:
-                parameter_schema = resolve_schema(parameter_data["schema"])
-                valid_value = value_utils.get_valid_value(parameter_schema)
-            if (
-                parameter_data["in"] == "query"
-                and parameter_to_invalidate not in params.keys()
-            ):
-                params[parameter_to_invalidate] = valid_value
-            if (
-                parameter_data["in"] == "header"
-                and parameter_to_invalidate not in headers.keys()
-            ):
-                headers[parameter_to_invalidate] = valid_value
+        if parameter_to_invalidate in params or parameter_to_invalidate in headers:
+            return params, headers
+        if values_from_constraint:
+            valid_value = choice(values_from_constraint)
+        else:
+            parameter_schema = resolve_schema(parameter_data["schema"])
+            valid_value = value_utils.get_valid_value(parameter_schema)
+        if parameter_data["in"] == "query":
+            params[parameter_to_invalidate] = valid_value
+        elif parameter_data["in"] == "header":
+            headers[parameter_to_invalidate] = valid_value
         return params, headers
 
     @keyword
@@ -1331,7 +1414,7 @@ class OpenApiLibCore:  # pylint: disable=too-many-instance-attributes
         for part, param_part in zip(
             reversed(endpoint_parts), reversed(parameterized_endpoint_parts)
         ):
-            if param_part.endswith("}"):
+            if _PARAM_RE.fullmatch(param_part):
                 resource_id = part
                 break
         if not resource_id:
@@ -1427,19 +1510,29 @@ class OpenApiLibCore:  # pylint: disable=too-many-instance-attributes
         > Note: provided username / password or auth objects take precedence over token
             based security
         """
-        headers = headers if headers else {}
-        if self.extra_headers:
-            headers.update(self.extra_headers)
-        # if both an auth object and a token are available, auth takes precedence
-        if self.security_token and not self.auth:
-            security_header = {"Authorization": self.security_token}
-            headers.update(security_header)
-        headers = {k: str(v) for k, v in headers.items()}
+        if headers:
+            # the base headers take precedence; if both an auth object and a
+            # token are available, auth takes precedence over the token
+            headers = {
+                **{k: str(v) for k, v in headers.items()},
+                **self._base_headers,
+            }
+        else:
+            headers = self._base_headers
+        # when orjson is available, serialize the body with it instead of the
+        # (slower) stdlib json used by requests
+        data: Optional[bytes] = None
+        if json_data is not None and orjson is not None:
+            data = orjson.dumps(json_data)
+            json_data = None
+            if "Content-Type" not in headers:
+                headers = {**headers, "Content-Type": "application/json"}
         response = self.session.request(
             url=url,
             method=method,
             params=params,
             headers=headers,
+            data=data,
             json=json_data,
             cookies=self.cookies,
             auth=self.auth,
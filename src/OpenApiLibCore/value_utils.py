@@ -2,157 +2,226 @@
 """Utility module with functions to handle OpenAPI value types and restrictions."""
 import base64
 import datetime
+import json
+import re
+import string
 from copy import deepcopy
+from functools import lru_cache, partial
+from ipaddress import IPv4Address, IPv6Address
 from logging import getLogger
-from random import choice, randint, uniform
-from typing import Any, Callable, Dict, List, Optional, Union
+from random import Random
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from uuid import uuid4
 
-import faker
 import rstr
 
+try:
+    from re import _constants as sre_constants  # type: ignore[attr-defined]
+    from re import _parser as sre_parse  # type: ignore[attr-defined]
+except ImportError:  # Python < 3.11
+    import sre_constants  # type: ignore[no-redef]
+    import sre_parse  # type: ignore[no-redef]
+
 JSON = Union[Dict[str, "JSON"], List["JSON"], str, int, float, bool, None]
 
 logger = getLogger(__name__)
 
 IGNORE = object()
 
+# Dedicated Random instance so value generation is isolated from other users
+# of the random module and can be made reproducible via seed() below
+_RNG = Random()
+_choice = _RNG.choice
+_randint = _RNG.randint
+_uniform = _RNG.uniform
 
-class LocalizedFaker:
-    """Class to support setting a locale post-init."""
 
-    # pylint: disable=missing-function-docstring
-    def __init__(self) -> None:
-        self.fake = faker.Faker()
+def seed(a: Any = None) -> None:
+    """Seed the random generator of this module, for reproducible generation."""
+    _RNG.seed(a)
 
-    def set_locale(self, locale: Union[str, List[str]]) -> None:
-        """Update the fake attribute with a Faker instance with the provided locale."""
-        self.fake = faker.Faker(locale)
 
-    @property
-    def date(self) -> Callable[[], str]:
-        return self.fake.date
+def _fast_uuid() -> str:
+    """Generate a uuid string without the Faker provider overhead."""
+    return str(uuid4())
 
-    @property
-    def date_time(self) -> Callable[[], datetime.datetime]:
-        return self.fake.date_time
 
-    @property
-    def password(self) -> Callable[[], str]:
-        return self.fake.password
+def _fast_ipv4() -> str:
+    """Generate an ipv4 address string without the Faker provider overhead."""
+    return str(IPv4Address(_RNG.getrandbits(32)))
 
-    @property
-    def binary(self) -> Callable[[], bytes]:
-        return self.fake.binary
 
-    @property
-    def email(self) -> Callable[[], str]:
-        return self.fake.safe_email
+def _fast_ipv6() -> str:
+    """Generate an ipv6 address string without the Faker provider overhead."""
+    return str(IPv6Address(_RNG.getrandbits(128)))
 
-    @property
-    def uuid(self) -> Callable[[], str]:
-        return self.fake.uuid4
 
-    @property
-    def uri(self) -> Callable[[], str]:
-        return self.fake.uri
+# Faker construction loads provider modules and locale data, so instances are
+# cached per locale and shared by all LocalizedFaker instances. The import
+# itself is postponed until the first instance is needed, since it dominates
+# the import time of this module.
+_FAKER_CACHE: Dict[Any, Any] = {}
 
-    @property
-    def url(self) -> Callable[[], str]:
-        return self.fake.url
 
-    @property
-    def hostname(self) -> Callable[[], str]:
-        return self.fake.hostname
+def _faker_for_locale(locale: Optional[Union[str, List[str]]]) -> Any:
+    """Return a (cached) Faker instance for the provided locale."""
+    key = tuple(locale) if isinstance(locale, list) else locale
+    cached_faker = _FAKER_CACHE.get(key)
+    if cached_faker is None:
+        import faker  # pylint: disable=import-outside-toplevel
 
-    @property
-    def ipv4(self) -> Callable[[], str]:
-        return self.fake.ipv4
+        cached_faker = faker.Faker(locale)
+        _FAKER_CACHE[key] = cached_faker
+    return cached_faker
 
-    @property
-    def ipv6(self) -> Callable[[], str]:
-        return self.fake.ipv6
 
-    @property
-    def name(self) -> Callable[[], str]:
-        return self.fake.name
+class LocalizedFaker:
+    """Class to support setting a locale post-init."""
 
-    @property
-    def text(self) -> Callable[[], str]:
-        return self.fake.text
+    date: Callable[[], str]
+    date_time: Callable[[], datetime.datetime]
+    password: Callable[[], str]
+    binary: Callable[[], bytes]
+    email: Callable[[], str]
+    uuid: Callable[[], str]
+    uri: Callable[[], str]
+    url: Callable[[], str]
+    hostname: Callable[[], str]
+    ipv4: Callable[[], str]
+    ipv6: Callable[[], str]
+    name: Callable[[], str]
+    text: Callable[[], str]
+    description: Callable[[], str]
+
+    def __init__(self) -> None:
+        # the Faker instance is only constructed when a provider is first used
+        self._fake: Optional[Any] = None
 
     @property
-    def description(self) -> Callable[[], str]:
-        return self.fake.text
+    def fake(self) -> Any:
+        """The wrapped Faker instance; constructed on first use."""
+        if self._fake is None:
+            self._initialize_faker()
+        return self._fake
+
+    def set_locale(self, locale: Union[str, List[str]]) -> None:
+        """Update the fake attribute with a Faker instance with the provided locale."""
+        self._fake = _faker_for_locale(locale)
+        self._bind_provider_methods()
+
+    def __getattr__(self, name: str) -> Any:
+        # the provider methods are bound on first use, so unused instances do
+        # not pay the faker import and construction cost
+        if self._fake is None:
+            self._initialize_faker()
+            return self.__getattribute__(name)
+        raise AttributeError(name)
+
+    def _initialize_faker(self) -> None:
+        self._fake = _faker_for_locale(None)
+        self._bind_provider_methods()
+
+    def _bind_provider_methods(self) -> None:
+        """
+        Bind the supported provider methods to the instance, so using them is a
+        single attribute lookup instead of a property call plus a lookup on fake.
+        """
+        fake = self._fake
+        self.date = fake.date
+        self.date_time = fake.date_time
+        self.password = fake.password
+        self.binary = fake.binary
+        self.email = fake.safe_email
+        self.uri = fake.uri
+        self.url = fake.url
+        self.hostname = fake.hostname
+        self.name = fake.name
+        self.text = fake.text
+        self.description = fake.text
+        # uuid / ipv4 / ipv6 values are locale independent, so the faster
+        # stdlib-based generators are used instead of the Faker providers
+        self.uuid = _fast_uuid
+        self.ipv4 = _fast_ipv4
+        self.ipv6 = _fast_ipv6
 
 
 FAKE = LocalizedFaker()
 
 
+# Mapping of the supported Python types to their JSON type name
+_JSON_TYPE_NAME_BY_PYTHON_TYPE: Dict[Any, str] = {
+    str: "string",
+    bool: "boolean",
+    int: "integer",
+    float: "number",
+    list: "array",
+    dict: "object",
+    type(None): "null",
+}
+
+
 def json_type_name_of_python_type(python_type: Any) -> str:
     """Return the JSON type name for supported Python types."""
-    if python_type == str:
-        return "string"
-    if python_type == bool:
-        return "boolean"
-    if python_type == int:
-        return "integer"
-    if python_type == float:
-        return "number"
-    if python_type == list:
-        return "array"
-    if python_type == dict:
-        return "object"
-    if python_type == type(None):
-        return "null"
-    raise ValueError(f"No json type mapping for Python type {python_type} available.")
+    try:
+        return _JSON_TYPE_NAME_BY_PYTHON_TYPE[python_type]
+    except KeyError:
+        raise ValueError(
+            f"No json type mapping for Python type {python_type} available."
+        ) from None
+
+
+# Reverse mapping; the type names and Python types form a bijection
+_PYTHON_TYPE_BY_JSON_TYPE_NAME: Dict[str, Any] = {
+    json_type_name: python_type
+    for python_type, json_type_name in _JSON_TYPE_NAME_BY_PYTHON_TYPE.items()
+}
 
 
 def python_type_by_json_type_name(type_name: str) -> Any:
     """Return the Python type based on the JSON type name."""
-    if type_name == "string":
-        return str
-    if type_name == "boolean":
-        return bool
-    if type_name == "integer":
-        return int
-    if type_name == "number":
-        return float
-    if type_name == "array":
-        return list
-    if type_name == "object":
-        return dict
-    if type_name == "null":
-        return type(None)
-    raise ValueError(f"No Python type mapping for JSON type '{type_name}' available.")
+    try:
+        return _PYTHON_TYPE_BY_JSON_TYPE_NAME[type_name]
+    except KeyError:
+        raise ValueError(
+            f"No Python type mapping for JSON type '{type_name}' available."
+        ) from None
 
 
-def get_valid_value(value_schema: Dict[str, Any]) -> Any:
-    """Return a random value that is valid under the provided value_schema."""
-    value_schema = deepcopy(value_schema)
+# Cache of compiled generators, keyed on the serialized schema
+_COMPILED_GENERATOR_CACHE: Dict[str, Callable[[], Any]] = {}
+# APIs stream a bounded number of distinct schemas; the cache is cleared if
+# that assumption does not hold, so it cannot grow without limit
+_COMPILED_GENERATOR_CACHE_MAX_SIZE = 1024
 
-    if value_schema.get("types"):
-        value_schema = choice(value_schema["types"])
 
-    if (from_const := value_schema.get("const")) is not None:
-        return from_const
-    if from_enum := value_schema.get("enum"):
-        return choice(from_enum)
+def compile_value_generator(value_schema: Dict[str, Any]) -> Callable[[], Any]:
+    """
+    Return a function that generates random values that are valid under the
+    provided value_schema.
 
-    value_type = value_schema["type"]
+    The returned function is a closure specialized for the schema: the const /
+    enum / type dispatch is resolved at compile time, so calling it does not
+    inspect the schema again. Compiled generators are cached per schema.
+    """
+    try:
+        cache_key = json.dumps(value_schema, sort_keys=True)
+    except TypeError:
+        # schemas holding non-JSON values cannot be keyed, so are not cached
+        return _value_generator_for(deepcopy(value_schema))
+    generator = _COMPILED_GENERATOR_CACHE.get(cache_key)
+    if generator is None:
+        if len(_COMPILED_GENERATOR_CACHE) >= _COMPILED_GENERATOR_CACHE_MAX_SIZE:
+            _COMPILED_GENERATOR_CACHE.clear()
+        # the generator closes over the schema, so take a copy to prevent
+        # mutations by the caller from affecting the cached generator
+        generator = _value_generator_for(deepcopy(value_schema))
+        _COMPILED_GENERATOR_CACHE[cache_key] = generator
+    return generator
 
-    if value_type == "null":
-        return None
-    if value_type == "boolean":
-        return FAKE.fake.boolean()
-    if value_type == "integer":
-        return get_random_int(value_schema=value_schema)
-    if value_type == "number":
-        return get_random_float(value_schema=value_schema)
-    if value_type == "string":
-        return get_random_string(value_schema=value_schema)
-    if value_type == "array":
-        return get_random_array(value_schema=value_schema)
-    raise NotImplementedError(f"Type '{value_type}' is currently not supported")
+
+def get_valid_value(value_schema: Dict[str, Any]) -> Any:
+    """Return a random value that is valid under the provided value_schema."""
+    return compile_value_generator(value_schema)()
 
 
 def get_invalid_value(
@@ -161,14 +230,12 @@ def get_invalid_value(
     values_from_constraint: Optional[List[Any]] = None,
 ) -> Any:
     """Return a random value that violates the provided value_schema."""
-    value_schema = deepcopy(value_schema)
-
     if value_schemas := value_schema.get("types"):
         if len(value_schemas) > 1:
             value_schemas = [
                 schema for schema in value_schemas if schema["type"] != "null"
             ]
-        value_schema = choice(value_schemas)
+        value_schema = _choice(value_schemas)
 
     invalid_value: Any = None
     value_type = value_schema["type"]
@@ -212,16 +279,20 @@ def get_invalid_value(
     return FAKE.uuid()
 
 
-def get_random_int(value_schema: Dict[str, Any]) -> int:
-    """Generate a random int within the min/max range of the schema, if specified."""
+# Default integer bounds for the OAS integer formats
+_INT_BOUNDS_BY_FORMAT = {
+    "int32": (-2147483648, 2147483647),
+    "int64": (-9223372036854775808, 9223372036854775807),
+}
+
+
+def _resolve_int_bounds(value_schema: Dict[str, Any]) -> Tuple[int, int]:
+    """Return the inclusive (minimum, maximum) int bounds based on the schema."""
     # Use int32 integers if "format" does not specify int64
     property_format = value_schema.get("format", "int32")
-    if property_format == "int64":
-        min_int = -9223372036854775808
-        max_int = 9223372036854775807
-    else:
-        min_int = -2147483648
-        max_int = 2147483647
+    min_int, max_int = _INT_BOUNDS_BY_FORMAT.get(
+        property_format, _INT_BOUNDS_BY_FORMAT["int32"]
+    )
     # OAS 3.0: exclusiveMinimum/Maximum is a bool in combination with minimum/maximum
     # OAS 3.1: exclusiveMinimum/Maximum is an integer
     minimum = value_schema.get("minimum", min_int)
@@ -238,11 +309,17 @@ def get_random_int(value_schema: Dict[str, Any]) -> int:
                 maximum -= 1
         else:
             maximum = exclusive_maximum - 1
-    return randint(minimum, maximum)
+    return minimum, maximum
 
 
-def get_random_float(value_schema: Dict[str, Any]) -> float:
-    """Generate a random float within the min/max range of the schema, if specified."""
+def get_random_int(value_schema: Dict[str, Any]) -> int:
+    """Generate a random int within the min/max range of the schema, if specified."""
+    minimum, maximum = _resolve_int_bounds(value_schema)
+    return _randint(minimum, maximum)
+
+
+def _resolve_float_bounds(value_schema: Dict[str, Any]) -> Tuple[float, float, bool]:
+    """Return the (minimum, maximum, exclude_boundaries) bounds based on the schema."""
     # Python floats are already double precision, so no check for "format"
     minimum = value_schema.get("minimum")
     maximum = value_schema.get("maximum")
@@ -281,19 +358,166 @@ def get_random_float(value_schema: Dict[str, Any]) -> float:
             f"maximum of {maximum} is equal to minimum of {minimum} and "
             f"exclusiveMinimum or exclusiveMaximum is specified"
         )
+    return minimum, maximum, exclude_boundaries
+
 
-    while exclude_boundaries:
-        result = uniform(minimum, maximum)
-        if minimum < result < maximum:  # pragma: no cover
+def get_random_float(value_schema: Dict[str, Any]) -> float:
+    """Generate a random float within the min/max range of the schema, if specified."""
+    minimum, maximum, exclude_boundaries = _resolve_float_bounds(value_schema)
+    result = _uniform(minimum, maximum)
+    if exclude_boundaries and not minimum < result < maximum:  # pragma: no cover
+        # uniform can return either boundary; the midpoint is always strictly
+        # between the (unequal) boundaries
+        result = (minimum + maximum) / 2
+    return result
+
+
+def get_random_int_batch(
+    value_schema: Dict[str, Any], number_of_values: int
+) -> List[int]:
+    """Generate a list of random ints, resolving the schema bounds only once."""
+    minimum, maximum = _resolve_int_bounds(value_schema)
+    return [_randint(minimum, maximum) for _ in range(number_of_values)]
+
+
+def get_random_float_batch(
+    value_schema: Dict[str, Any], number_of_values: int
+) -> List[float]:
+    """Generate a list of random floats, resolving the schema bounds only once."""
+    minimum, maximum, exclude_boundaries = _resolve_float_bounds(value_schema)
+    if not exclude_boundaries:
+        return [_uniform(minimum, maximum) for _ in range(number_of_values)]
+    values = []
+    for _ in range(number_of_values):
+        result = _uniform(minimum, maximum)
+        if not minimum < result < maximum:  # pragma: no cover
+            result = (minimum + maximum) / 2
+        values.append(result)
+    return values
+
+
+_XEGER = rstr.Xeger()
+
+# Character pools for the compiled pattern emitters
+_ANY_CHARS = string.ascii_letters + string.digits + string.punctuation + " "
+_CATEGORY_CHARS = {
+    sre_constants.CATEGORY_DIGIT: string.digits,
+    sre_constants.CATEGORY_WORD: string.ascii_letters + string.digits + "_",
+    sre_constants.CATEGORY_SPACE: " \t",
+}
+# emitted length for unbounded repeats, in line with the rstr default
+_UNBOUNDED_REPEAT_LIMIT = 10
+
+
+class _UnsupportedPattern(Exception):
+    """Raised when a pattern holds nodes that cannot be compiled to an emitter."""
+
+
+@lru_cache(maxsize=512)
+def _parsed_pattern(pattern: str) -> Any:
+    """Return the parsed regex tree for the pattern; parsing is cached per pattern."""
+    return sre_parse.parse(pattern)
+
+
+def _chars_for_in(items: Any) -> str:
+    """Return the character pool for the items of a parsed IN node."""
+    chars: List[str] = []
+    for item_op, argument in items:
+        if item_op is sre_constants.LITERAL:
+            chars.append(chr(argument))
+        elif item_op is sre_constants.RANGE:
+            low, high = argument
+            chars.extend(map(chr, range(low, high + 1)))
+        elif item_op is sre_constants.CATEGORY:
+            category_chars = _CATEGORY_CHARS.get(argument)
+            if category_chars is None:
+                raise _UnsupportedPattern(f"category {argument}")
+            chars.append(category_chars)
+        else:
+            raise _UnsupportedPattern(f"op {item_op}")
+    return "".join(chars)
+
+
+def _compile_nodes(nodes: Any) -> Callable[[], str]:
+    """Compile a sequence of parsed regex nodes into an emitter function."""
+    emitters = [_compile_node(node) for node in nodes]
+    if len(emitters) == 1:
+        return emitters[0]
+    return lambda: "".join(emitter() for emitter in emitters)
+
+
+def _compile_node(node: Any) -> Callable[[], str]:
+    """Compile a single parsed regex node into an emitter function."""
+    op, argument = node
+    if op is sre_constants.LITERAL:
+        literal = chr(argument)
+        return lambda: literal
+    if op is sre_constants.IN:
+        pool = _chars_for_in(argument)
+        return lambda: _choice(pool)
+    if op is sre_constants.ANY:
+        return lambda: _choice(_ANY_CHARS)
+    if op in (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT):
+        minimum, maximum, subpattern = argument
+        if maximum == sre_constants.MAXREPEAT:
+            maximum = max(minimum, _UNBOUNDED_REPEAT_LIMIT)
+        emitter = _compile_nodes(subpattern)
+        return lambda: "".join(emitter() for _ in range(_randint(minimum, maximum)))
+    if op is sre_constants.SUBPATTERN:
+        return _compile_nodes(argument[-1])
+    if op is sre_constants.BRANCH:
+        branch_emitters = [_compile_nodes(branch) for branch in argument[1]]
+        return lambda: _choice(branch_emitters)()
+    if op is sre_constants.AT:
+        # anchors do not emit characters
+        return lambda: ""
+    raise _UnsupportedPattern(f"op {op}")
+
+
+# Cache of compiled pattern emitters, keyed on the pattern
+_PATTERN_GENERATOR_CACHE: Dict[str, Callable[[], str]] = {}
+
+
+def _xeger_string(pattern: str) -> str:
+    """Generate a matching string via rstr, reusing the cached parse tree."""
+    # pylint: disable=protected-access
+    # rstr ignores lookaround assertions, so a draw can violate the pattern;
+    # redraw a limited number of times and verify against the compiled regex
+    compiled_pattern = re.compile(pattern)
+    for _ in range(100):
+        try:
+            result: str = _XEGER._build_string(_parsed_pattern(pattern))
+            _XEGER._cache.clear()
+        except Exception:  # pragma: no cover - safety net for rstr internals changing
+            result = rstr.xeger(pattern)
+        if compiled_pattern.search(result):
             return result
-    return uniform(minimum, maximum)
+    return result
+
+
+def _string_from_pattern(pattern: str) -> str:
+    """
+    Generate a random string that matches the provided regex pattern.
+
+    Patterns are compiled into a plain-Python emitter on first use; patterns
+    holding constructs the emitter does not support (e.g. lookarounds and
+    backreferences) fall back to rstr.
+    """
+    generator = _PATTERN_GENERATOR_CACHE.get(pattern)
+    if generator is None:
+        try:
+            generator = _compile_nodes(_parsed_pattern(pattern))
+        except _UnsupportedPattern:
+            generator = partial(_xeger_string, pattern)
+        _PATTERN_GENERATOR_CACHE[pattern] = generator
+    return generator()
 
 
 def get_random_string(value_schema: Dict[str, Any]) -> Union[bytes, str]:
     """Generate a random string within the min/max length in the schema, if specified."""
     # if a pattern is provided, format and min/max length can be ignored
     if pattern := value_schema.get("pattern"):
-        return rstr.xeger(pattern)
+        return _string_from_pattern(pattern)
     minimum = value_schema.get("minLength", 0)
     maximum = value_schema.get("maxLength", 36)
     if minimum > maximum:
@@ -304,27 +528,66 @@ def get_random_string(value_schema: Dict[str, Any]) -> Union[bytes, str]:
         data = FAKE.uuid()
         return base64.b64encode(data.encode("utf-8"))
     value = fake_string(string_format=format_)
-    while len(value) < minimum:
-        # use fake.name() to ensure the returned string uses the provided locale
-        value = value + FAKE.name()
+    if len(value) < minimum:
+        # collect the parts and join once to prevent quadratic string building
+        parts = [value]
+        length = len(value)
+        while length < minimum:
+            # use fake.name() to ensure the returned string uses the provided locale
+            part = FAKE.name()
+            parts.append(part)
+            length += len(part)
+        value = "".join(parts)
     if len(value) > maximum:
         value = value[:maximum]
     return value
 
 
+_FORMAT_TRANSLATION = str.maketrans("-", "_")
+
+
+@lru_cache(maxsize=None)
+def _normalized_format(string_format: str) -> str:
+    """Return the format as a valid Python name; normalization is cached per format."""
+    # format names may contain -, which is invalid in Python naming
+    return string_format.translate(_FORMAT_TRANSLATION)
+
+
 def fake_string(string_format: str) -> str:
     """
     Generate a random string based on the provided format if the format is supported.
     """
-    # format names may contain -, which is invalid in Python naming
-    string_format = string_format.replace("-", "_")
-    fake_generator = getattr(FAKE, string_format, FAKE.uuid)
+    fake_generator = getattr(FAKE, _normalized_format(string_format), FAKE.uuid)
     value: str = fake_generator()
     if isinstance(value, datetime.datetime):
         return value.strftime("%Y-%m-%dT%H:%M:%SZ")
     return value
 
 
+def _value_generator_for(value_schema: Dict[str, Any]) -> Callable[[], Any]:
+    """
+    Return a function that generates random values that are valid under the
+    provided value_schema. The schema is only inspected once, so the returned
+    function can cheaply generate any number of values.
+    """
+    if types := value_schema.get("types"):
+        return lambda: get_valid_value(_choice(types))
+    if (from_const := value_schema.get("const")) is not None:
+        return lambda: from_const
+    if from_enum := value_schema.get("enum"):
+        return lambda: _choice(from_enum)
+
+    value_type = value_schema["type"]
+
+    try:
+        value_generator = _VALUE_GENERATOR_BY_TYPE[value_type]
+    except KeyError:
+        raise NotImplementedError(
+            f"Type '{value_type}' is currently not supported"
+        ) from None
+    return lambda: value_generator(value_schema)
+
+
 def get_random_array(value_schema: Dict[str, Any]) -> List[Any]:
     """Generate a list with random elements as specified by the schema."""
     minimum = value_schema.get("minItems", 0)
@@ -332,11 +595,34 @@ def get_random_array(value_schema: Dict[str, Any]) -> List[Any]:
     if minimum > maximum:
         maximum = minimum
     items_schema = value_schema["items"]
-    value = []
-    for _ in range(maximum):
-        item_value = get_valid_value(items_schema)
-        value.append(item_value)
-    return value
+    # fast path for plain integer items: resolve the bounds once so large
+    # arrays do not re-read the schema for every item
+    if items_schema.get("type") == "integer" and not any(
+        key in items_schema for key in ("types", "const", "enum")
+    ):
+        item_minimum, item_maximum = _resolve_int_bounds(items_schema)
+        return [_randint(item_minimum, item_maximum) for _ in range(maximum)]
+    # the (cached) generator is resolved once and bound to a local name, so the
+    # loop does not re-inspect the items schema or perform attribute lookups
+    value_generator = compile_value_generator(items_schema)
+    return [value_generator() for _ in range(maximum)]
+
+
+# Dispatch table for get_valid_value, defined after the generator functions
+# it refers to
+_VALUE_GENERATOR_BY_TYPE: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+    "null": lambda value_schema: None,
+    "boolean": lambda value_schema: FAKE.fake.boolean(),
+    "integer": get_random_int,
+    "number": get_random_float,
+    "string": get_random_string,
+    "array": get_random_array,
+}
+
+
+# Frozen type-name sets for the hot membership checks
+_NUMERIC_TYPES = frozenset({"integer", "number"})
+_CONSTRAINT_TYPES = frozenset({"string", "integer", "number", "array", "object"})
 
 
 def get_invalid_value_from_constraint(
@@ -349,22 +635,22 @@ def get_invalid_value_from_constraint(
     # if IGNORE is in the values_from_constraints, the parameter needs to be
     # ignored for an OK response so leaving the value at it's original value
     # should result in the specified error response
-    if IGNORE in values_from_constraint:
+    # check by identity, so no (potentially costly) __eq__ calls are made on the
+    # values in the list
+    if any(value is IGNORE for value in values_from_constraint):
         return IGNORE
     # if the value is forced True or False, return the opposite to invalidate
     if len(values_from_constraint) == 1 and value_type == "boolean":
         return not values_from_constraint[0]
     # for unsupported types or empty constraints lists return None
-    if (
-        value_type not in ["string", "integer", "number", "array", "object"]
-        or not values_from_constraint
-    ):
+    if value_type not in _CONSTRAINT_TYPES or not values_from_constraint:
         return None
 
-    values_from_constraint = deepcopy(values_from_constraint)
+    # only the object and array branches can mutate a value from the constraint,
+    # so copy just the value that is used instead of the full list
     # for objects, keep the keys intact but update the values
     if value_type == "object":
-        valid_object = values_from_constraint.pop()
+        valid_object = deepcopy(values_from_constraint[-1])
         invalid_object = {}
         for key, value in valid_object.items():
             python_type_of_value = type(value)
@@ -377,7 +663,7 @@ def get_invalid_value_from_constraint(
 
     # for arrays, update each value in the array to a value of the same type
     if value_type == "array":
-        valid_array = values_from_constraint.pop()
+        valid_array = deepcopy(values_from_constraint[-1])
         invalid_array = []
         for value in valid_array:
             python_type_of_value = type(value)
@@ -389,52 +675,120 @@ def get_invalid_value_from_constraint(
             invalid_array.append(invalid_value)
         return invalid_array
 
-    invalid_values = 2 * values_from_constraint
-    invalid_value = invalid_values.pop()
-    if value_type in ["integer", "number"]:
-        for value in invalid_values:
-            invalid_value = abs(invalid_value) + abs(value)
+    # combine the values, repeated so single-item constraints are also invalidated
+    if value_type in _NUMERIC_TYPES:
+        invalid_value = 2 * sum(map(abs, values_from_constraint))
         if not invalid_value:
             invalid_value += 1
         return invalid_value
-    for value in invalid_values:
-        invalid_value = invalid_value + value
+    # at this point only string values remain
+    invalid_value = "".join(2 * values_from_constraint)
     # None for empty string
     return invalid_value if invalid_value else None
 
 
 def get_invalid_value_from_enum(values: List[Any], value_type: str) -> Any:
     """Return a value not in the enum by combining the enum values."""
+    if value_type == "boolean":
+        # if both True and False are allowed, there is no bool to invalidate with
+        if len(set(values)) > 1:
+            return None
+        return not values[0]
+    # repeat each value in the combination to ensure single-item enums are invalidated
     if value_type == "string":
-        invalid_value: Any = ""
-    elif value_type in ["integer", "number"]:
-        invalid_value = 0
-    elif value_type == "array":
-        invalid_value = []
-    elif value_type == "object":
+        return "".join(value + value for value in values)
+    if value_type in _NUMERIC_TYPES:
+        return sum(abs(value) + abs(value) for value in values)
+    if value_type == "array":
+        return [item for value in values for item in value + value]
+    if value_type == "object":
         # force creation of a new object since we will be modifying it
         invalid_value = {**values[0]}
-    else:
-        logger.warning(f"Cannot invalidate enum value with type {value_type}")
-        return None
-    for value in values:
-        # repeat each addition to ensure single-item enums are invalidated
-        if value_type in ["integer", "number"]:
-            invalid_value += abs(value) + abs(value)
-        if value_type == "string":
-            invalid_value += value + value
-        if value_type == "array":
-            invalid_value.extend(value)
-            invalid_value.extend(value)
-        # objects are a special case, since they must be of the same type / class
-        # invalid_value.update(value) will end up with the last value in the list,
-        # which is a valid value, so another approach is needed
-        if value_type == "object":
+        for value in values:
+            # objects are a special case, since they must be of the same type / class
+            # invalid_value.update(value) will end up with the last value in the list,
+            # which is a valid value, so another approach is needed
             for key in invalid_value.keys():
                 invalid_value[key] = value.get(key)
                 if invalid_value not in values:
                     return invalid_value
-    return invalid_value
+        return invalid_value
+    logger.warning(f"Cannot invalidate enum value with type {value_type}")
+    return None
+
+
+def _numeric_out_of_bounds(value_schema: Dict[str, Any], current_value: Any) -> Any:
+    """Return a number just outside the schema bounds, if any."""
+    # pylint: disable=unused-argument
+    schema_get = value_schema.get
+    if (minimum := schema_get("minimum")) is not None:
+        if schema_get("exclusiveMinimum") is True:
+            return minimum
+        return minimum - 1
+    if (maximum := schema_get("maximum")) is not None:
+        if schema_get("exclusiveMaximum") is True:
+            return maximum
+        return maximum + 1
+    # In OAS 3.1 exclusveMinimum/Maximum are no longer boolean but instead integer
+    # or number and minimum/maximum should not be used with exclusiveMinimum/Maximum
+    if (exclusive_minimum := schema_get("exclusiveMinimum")) is not None:
+        return exclusive_minimum
+    if (exclusive_maximum := schema_get("exclusiveMaximum")) is not None:
+        return exclusive_maximum
+    return None
+
+
+def _array_out_of_bounds(value_schema: Dict[str, Any], current_value: Any) -> Any:
+    """Return an array just outside the schema length range, if any."""
+    schema_get = value_schema.get
+    if (minimum := schema_get("minItems", 0)) > 0:
+        return current_value[0 : minimum - 1]
+    if (maximum := schema_get("maxItems")) is not None:
+        # build a new list of the final size instead of growing the
+        # caller's list in place
+        base = current_value if current_value else ["x"]
+        return base + [_choice(base) for _ in range(maximum + 1 - len(base))]
+    return None
+
+
+def _string_out_of_bounds(value_schema: Dict[str, Any], current_value: Any) -> Any:
+    """Return a string just outside the schema length range, if any."""
+    schema_get = value_schema.get
+    # if there is a minimum length, send 1 character less
+    if minimum := schema_get("minLength", 0):
+        return current_value[0 : minimum - 1]
+    # if there is a maximum length, send 1 character more
+    if maximum := schema_get("maxLength"):
+        # add random characters from the current value to prevent adding new
+        # characters; join once instead of concatenating one at a time
+        base = current_value if current_value else "x"
+        return base + "".join(
+            _choice(base) for _ in range(maximum + 1 - len(base))
+        )
+    return None
+
+
+# Dispatch table for get_value_out_of_bounds; types without bounds are absent
+_OUT_OF_BOUNDS_HANDLER_BY_TYPE: Dict[str, Callable[[Dict[str, Any], Any], Any]] = {
+    "integer": _numeric_out_of_bounds,
+    "number": _numeric_out_of_bounds,
+    "array": _array_out_of_bounds,
+    "string": _string_out_of_bounds,
+}
+
+# The schema keys that can put a value or length bound on a value
+_BOUND_KEYS = frozenset(
+    (
+        "minimum",
+        "maximum",
+        "exclusiveMinimum",
+        "exclusiveMaximum",
+        "minLength",
+        "maxLength",
+        "minItems",
+        "maxItems",
+    )
+)
 
 
 def get_value_out_of_bounds(value_schema: Dict[str, Any], current_value: Any) -> Any:
@@ -442,40 +796,9 @@ def get_value_out_of_bounds(value_schema: Dict[str, Any], current_value: Any) ->
     Return a value just outside the value or length range if specified in the
     provided schema, otherwise None is returned.
     """
-    value_type = value_schema["type"]
-
-    if value_type in ["integer", "number"]:
-        if (minimum := value_schema.get("minimum")) is not None:
-            if value_schema.get("exclusiveMinimum") is True:
-                return minimum
-            return minimum - 1
-        if (maximum := value_schema.get("maximum")) is not None:
-            if value_schema.get("exclusiveMaximum") is True:
-                return maximum
-            return maximum + 1
-        # In OAS 3.1 exclusveMinimum/Maximum are no longer boolean but instead integer
-        # or number and minimum/maximum should not be used with exclusiveMinimum/Maximum
-        if (exclusive_minimum := value_schema.get("exclusiveMinimum")) is not None:
-            return exclusive_minimum
-        if (exclusive_maximum := value_schema.get("exclusiveMaximum")) is not None:
-            return exclusive_maximum
-    if value_type == "array":
-        if minimum := value_schema.get("minItems", 0) > 0:
-            return current_value[0 : minimum - 1]
-        if (maximum := value_schema.get("maxItems")) is not None:
-            invalid_value = current_value if current_value else ["x"]
-            while len(invalid_value) <= maximum:
-                invalid_value.append(choice(invalid_value))
-            return invalid_value
-    if value_type == "string":
-        # if there is a minimum length, send 1 character less
-        if minimum := value_schema.get("minLength", 0):
-            return current_value[0 : minimum - 1]
-        # if there is a maximum length, send 1 character more
-        if maximum := value_schema.get("maxLength"):
-            invalid_value = current_value if current_value else "x"
-            # add random characters from the current value to prevent adding new characters
-            while len(invalid_value) <= maximum:
-                invalid_value += choice(invalid_value)
-            return invalid_value
-    return None
+    handler = _OUT_OF_BOUNDS_HANDLER_BY_TYPE.get(value_schema["type"])
+    # a single set intersection replaces the per-bound membership checks for
+    # the common case of a schema without any bounds
+    if handler is None or _BOUND_KEYS.isdisjoint(value_schema):
+        return None
+    return handler(value_schema, current_value)
@@ -34,8 +34,9 @@ def utests(context: Context) -> None:
         "coverage",
         "run",
         "-m",
-        "unittest",
-        "discover ",
+        "pytest",
+        # xdist workers are subprocesses that escape coverage measurement
+        "-n 0",
         f"{ROOT}/tests/unittests",
     ]
     subprocess.run(" ".join(cmd), shell=True, check=False)
@@ -0,0 +1,19 @@
+"""Shared fixtures for the unit tests."""
+
+import sys
+from pathlib import Path
+from typing import Any, Dict
+
+import pytest
+
+_TESTS_FOLDER = Path(__file__).parent.parent.resolve().as_posix()
+
+
+@pytest.fixture(scope="session")
+def rf_variables() -> Dict[str, Any]:
+    """The memoized Robot Framework variable dict from tests/variables.py."""
+    if _TESTS_FOLDER not in sys.path:
+        sys.path.insert(0, _TESTS_FOLDER)
+    from variables import get_variables  # pylint: disable=import-outside-toplevel
+
+    return get_variables()
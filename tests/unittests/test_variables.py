@@ -0,0 +1,17 @@
+# pylint: disable="missing-function-docstring"
+from typing import Any, Dict
+
+from OpenApiLibCore import DefaultDto, IdReference
+
+
+def test_get_variables_is_memoized(rf_variables: Dict[str, Any]) -> None:
+    from variables import get_variables  # pylint: disable=import-outside-toplevel
+
+    assert get_variables() is rf_variables
+
+
+def test_variable_contents(rf_variables: Dict[str, Any]) -> None:
+    assert isinstance(rf_variables["ID_REFERENCE"], IdReference)
+    assert isinstance(rf_variables["INVALID_ID_REFERENCE"], IdReference)
+    assert rf_variables["DEFAULT_DTO"] is DefaultDto
+    assert rf_variables["EXTRA_HEADERS"] == {"foo": "bar", "eggs": "bacon"}
@@ -0,0 +1,10 @@
+from OpenApiLibCore import value_utils
+
+# Shared across the test modules in this package; constructing a LocalizedFaker
+# is the dominant cost of the value_utils tests.
+_SHARED_FAKER = value_utils.LocalizedFaker()
+
+
+def get_shared_faker() -> value_utils.LocalizedFaker:
+    """Return the LocalizedFaker instance shared by the test modules."""
+    return _SHARED_FAKER
@@ -16,7 +16,8 @@ class TestGetInvalidValue(unittest.TestCase):
             values_from_constraint=values_from_constraints,
         )
         self.assertNotIn(value, values_from_constraints)
-        self.assertIsInstance(value, int)
+        # exact type check, since bool is a subclass of int
+        self.assertIs(type(value), int)
 
         value_schema = {"type": "null"}
         value = value_utils.get_invalid_value(
@@ -36,7 +37,7 @@ class TestGetInvalidValue(unittest.TestCase):
             current_value=current_value,
         )
         self.assertNotIn(value, enum_values)
-        self.assertIsInstance(value, float)
+        self.assertIs(type(value), float)
 
         value_schema = {"type": "null", "enum": enum_values}
         value = value_utils.get_invalid_value(
@@ -21,46 +21,48 @@ class TestGetValidValue(unittest.TestCase):
     def test_bool(self) -> None:
         schema = {"type": "boolean"}
         value = value_utils.get_valid_value(schema)
-        self.assertIsInstance(value, bool)
+        self.assertIs(type(value), bool)
 
     def test_integer(self) -> None:
         schema = {"type": "integer"}
         value = value_utils.get_valid_value(schema)
-        self.assertIsInstance(value, int)
+        # exact type check, since bool is a subclass of int
+        self.assertIs(type(value), int)
 
     def test_number(self) -> None:
         schema = {"type": "number"}
         value = value_utils.get_valid_value(schema)
-        self.assertIsInstance(value, float)
+        self.assertIs(type(value), float)
 
     def test_string(self) -> None:
         schema = {"type": "string"}
         value = value_utils.get_valid_value(schema)
-        self.assertIsInstance(value, str)
+        self.assertIs(type(value), str)
 
     def test_bool_array(self) -> None:
         schema = {"type": "array", "items": {"type": "boolean"}}
         value = value_utils.get_valid_value(schema)
         self.assertIsInstance(value, list)
-        self.assertIsInstance(value[0], bool)
+        self.assertIs(type(value[0]), bool)
 
     def test_int_array(self) -> None:
         schema = {"type": "array", "items": {"type": "integer"}}
         value = value_utils.get_valid_value(schema)
         self.assertIsInstance(value, list)
-        self.assertIsInstance(value[0], int)
+        # exact type check, since bool is a subclass of int
+        self.assertIs(type(value[0]), int)
 
     def test_number_array(self) -> None:
         schema = {"type": "array", "items": {"type": "number"}}
         value = value_utils.get_valid_value(schema)
         self.assertIsInstance(value, list)
-        self.assertIsInstance(value[0], float)
+        self.assertIs(type(value[0]), float)
 
     def test_string_array(self) -> None:
         schema = {"type": "array", "items": {"type": "string"}}
         value = value_utils.get_valid_value(schema)
         self.assertIsInstance(value, list)
-        self.assertIsInstance(value[0], str)
+        self.assertIs(type(value[0]), str)
 
     def test_raises(self) -> None:
         schema = {"type": "object"}
@@ -23,21 +23,15 @@ class TestInvalidValueFromConstraint(unittest.TestCase):
         self.assertEqual(value, None)
 
     def test_bool(self) -> None:
-        values = [True]
-        value = value_utils.get_invalid_value_from_constraint(
-            values_from_constraint=values,
-            value_type="boolean",
-        )
-        self.assertNotIn(value, values)
-        self.assertIsInstance(value, bool)
-
-        values = [False]
-        value = value_utils.get_invalid_value_from_constraint(
-            values_from_constraint=values,
-            value_type="boolean",
-        )
-        self.assertNotIn(value, values)
-        self.assertIsInstance(value, bool)
+        cases: List[List[Any]] = [[True], [False]]
+        for values in cases:
+            with self.subTest(values=values):
+                value = value_utils.get_invalid_value_from_constraint(
+                    values_from_constraint=values,
+                    value_type="boolean",
+                )
+                self.assertNotIn(value, values)
+                self.assertIs(type(value), bool)
 
         values = [True, False]
         value = value_utils.get_invalid_value_from_constraint(
@@ -47,21 +41,15 @@ class TestInvalidValueFromConstraint(unittest.TestCase):
         self.assertEqual(value, None)
 
     def test_string(self) -> None:
-        values = ["foo"]
-        value = value_utils.get_invalid_value_from_constraint(
-            values_from_constraint=values,
-            value_type="string",
-        )
-        self.assertNotIn(value, values)
-        self.assertIsInstance(value, str)
-
-        values = ["foo", "bar", "baz"]
-        value = value_utils.get_invalid_value_from_constraint(
-            values_from_constraint=values,
-            value_type="string",
-        )
-        self.assertNotIn(value, values)
-        self.assertIsInstance(value, str)
+        cases: List[List[Any]] = [["foo"], ["foo", "bar", "baz"]]
+        for values in cases:
+            with self.subTest(values=values):
+                value = value_utils.get_invalid_value_from_constraint(
+                    values_from_constraint=values,
+                    value_type="string",
+                )
+                self.assertNotIn(value, values)
+                self.assertIsInstance(value, str)
 
         values = [""]
         value = value_utils.get_invalid_value_from_constraint(
@@ -71,53 +59,37 @@ class TestInvalidValueFromConstraint(unittest.TestCase):
         self.assertEqual(value, None)
 
     def test_integer(self) -> None:
-        values = [0]
-        value = value_utils.get_invalid_value_from_constraint(
-            values_from_constraint=values,
-            value_type="integer",
-        )
-        self.assertNotIn(value, values)
-        self.assertIsInstance(value, int)
-
-        values = [-3, 0, 3]
-        value = value_utils.get_invalid_value_from_constraint(
-            values_from_constraint=values,
-            value_type="integer",
-        )
-        self.assertNotIn(value, values)
-        self.assertIsInstance(value, int)
+        cases: List[List[Any]] = [[0], [-3, 0, 3]]
+        for values in cases:
+            with self.subTest(values=values):
+                value = value_utils.get_invalid_value_from_constraint(
+                    values_from_constraint=values,
+                    value_type="integer",
+                )
+                self.assertNotIn(value, values)
+                # exact type check, since bool is a subclass of int
+                self.assertIs(type(value), int)
 
     def test_number(self) -> None:
-        values = [0.0]
-        value = value_utils.get_invalid_value_from_constraint(
-            values_from_constraint=values,
-            value_type="number",
-        )
-        self.assertNotIn(value, values)
-        self.assertIsInstance(value, float)
-
-        values = [-0.1, 0.0, 0.1]
-        value = value_utils.get_invalid_value_from_constraint(
-            values_from_constraint=values,
-            value_type="number",
-        )
-        self.assertNotIn(value, values)
-        self.assertIsInstance(value, float)
+        cases: List[List[Any]] = [[0.0], [-0.1, 0.0, 0.1]]
+        for values in cases:
+            with self.subTest(values=values):
+                value = value_utils.get_invalid_value_from_constraint(
+                    values_from_constraint=values,
+                    value_type="number",
+                )
+                self.assertNotIn(value, values)
+                self.assertIs(type(value), float)
 
     def test_array(self) -> None:
-        values: List[Any] = [[42]]
-        value = value_utils.get_invalid_value_from_constraint(
-            values_from_constraint=values,
-            value_type="array",
-        )
-        self.assertNotIn(value, values)
-
-        values = [["spam"], ["ham", "eggs"]]
-        value = value_utils.get_invalid_value_from_constraint(
-            values_from_constraint=values,
-            value_type="array",
-        )
-        self.assertNotIn(value, values)
+        cases: List[List[Any]] = [[[42]], [["spam"], ["ham", "eggs"]]]
+        for values in cases:
+            with self.subTest(values=values):
+                value = value_utils.get_invalid_value_from_constraint(
+                    values_from_constraint=values,
+                    value_type="array",
+                )
+                self.assertNotIn(value, values)
 
         values = []
         value = value_utils.get_invalid_value_from_constraint(
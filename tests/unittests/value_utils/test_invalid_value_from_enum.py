@@ -5,6 +5,21 @@ from OpenApiLibCore import value_utils
 
 
 class TestInvalidValueFromEnum(unittest.TestCase):
+    def test_boolean(self) -> None:
+        value_list = [True]
+        result = value_utils.get_invalid_value_from_enum(
+            values=value_list,
+            value_type="boolean",
+        )
+        self.assertEqual(result, False)
+
+        value_list = [True, False]
+        result = value_utils.get_invalid_value_from_enum(
+            values=value_list,
+            value_type="boolean",
+        )
+        self.assertEqual(result, None)
+
     def test_string(self) -> None:
         value_list = ["foo", "bar"]
         result = value_utils.get_invalid_value_from_enum(
@@ -4,11 +4,19 @@ import unittest
 
 from OpenApiLibCore import value_utils
 
+from . import get_shared_faker
+
 
 class TestLocalizedFaker(unittest.TestCase):
+    faker: value_utils.LocalizedFaker
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        # share one instance for the tests that do not change the locale
+        cls.faker = get_shared_faker()
+
     def test_default_locale(self) -> None:
-        default_faker = value_utils.LocalizedFaker()
-        self.assertEqual(default_faker.fake.locales, ["en_US"])
+        self.assertEqual(self.faker.fake.locales, ["en_US"])
 
     def test_set_locale(self) -> None:
         faker = value_utils.LocalizedFaker()
@@ -20,22 +28,26 @@ class TestLocalizedFaker(unittest.TestCase):
         self.assertEqual(faker.fake.locales, ["ar_AA", "zh_TW"])
 
     def test_custom_provider_types(self) -> None:
-        faker = value_utils.LocalizedFaker()
-
-        self.assertIsInstance(faker.date(), str)
-        self.assertIsInstance(faker.date_time(), datetime.datetime)
-        self.assertIsInstance(faker.password(), str)
-        self.assertIsInstance(faker.binary(), bytes)
-        self.assertIsInstance(faker.email(), str)
-        self.assertIsInstance(faker.uuid(), str)
-        self.assertIsInstance(faker.uri(), str)
-        self.assertIsInstance(faker.url(), str)
-        self.assertIsInstance(faker.hostname(), str)
-        self.assertIsInstance(faker.ipv4(), str)
-        self.assertIsInstance(faker.ipv6(), str)
-        self.assertIsInstance(faker.name(), str)
-        self.assertIsInstance(faker.text(), str)
-        self.assertIsInstance(faker.description(), str)
+        cases = [
+            ("date", str),
+            ("date_time", datetime.datetime),
+            ("password", str),
+            ("binary", bytes),
+            ("email", str),
+            ("uuid", str),
+            ("uri", str),
+            ("url", str),
+            ("hostname", str),
+            ("ipv4", str),
+            ("ipv6", str),
+            ("name", str),
+            ("text", str),
+            ("description", str),
+        ]
+        for provider_name, expected_type in cases:
+            with self.subTest(provider=provider_name):
+                provider = getattr(self.faker, provider_name)
+                self.assertIsInstance(provider(), expected_type)
 
 
 if __name__ == "__main__":
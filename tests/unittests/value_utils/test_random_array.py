@@ -28,6 +28,14 @@ class TestRandomArray(unittest.TestCase):
         value = value_utils.get_random_array(schema)
         self.assertEqual(len(value), 7)
 
+    def test_items_generator_is_reused(self) -> None:
+        items_schema = {"type": "string", "maxLength": 3}
+        schema = {"maxItems": 2, "items": items_schema}
+        value_utils.get_random_array(schema)
+        generator = value_utils.compile_value_generator(items_schema)
+        value_utils.get_random_array(schema)
+        self.assertIs(value_utils.compile_value_generator(items_schema), generator)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -70,6 +70,16 @@ class TestRandomFloat(unittest.TestCase):
         schema = {"minimum": 1.0, "maximum": 1.0, "exclusiveMaximum": True}
         self.assertRaises(ValueError, value_utils.get_random_float, schema)
 
+    def test_batch(self) -> None:
+        schema: Dict[str, Any] = {"minimum": -0.2, "maximum": 0.1}
+        values = value_utils.get_random_float_batch(schema, number_of_values=1000)
+        self.assertEqual(len(values), 1000)
+        self.assertTrue(all(-0.2 <= value <= 0.1 for value in values))
+
+        schema = {"minimum": 2.1, "maximum": 2.2, "exclusiveMinimum": True}
+        values = value_utils.get_random_float_batch(schema, number_of_values=1000)
+        self.assertTrue(all(2.1 < value < 2.2 for value in values))
+
     def test_min_max(self) -> None:
         schema = {"minimum": 1.1, "maximum": 1.1}
         value = value_utils.get_random_float(schema)
@@ -67,6 +67,12 @@ class TestRandomInteger(unittest.TestCase):
         value = value_utils.get_random_int(schema)
         self.assertEqual(value, -42)
 
+    def test_batch(self) -> None:
+        schema = {"minimum": -42, "maximum": 42}
+        values = value_utils.get_random_int_batch(schema, number_of_values=1000)
+        self.assertEqual(len(values), 1000)
+        self.assertTrue(all(-42 <= value <= 42 for value in values))
+
     def test_int64(self) -> None:
         schema = {"maximum": -9223372036854775808, "format": "int64"}
         value = value_utils.get_random_int(schema)
@@ -1,8 +1,16 @@
 # pylint: disable="missing-class-docstring", "missing-function-docstring"
+import re
 import unittest
 
 from OpenApiLibCore import value_utils
 
+# compiled once at module scope, so the assertions do not re-compile per call
+_DT_RE = re.compile(
+    r"^(\d{4})-(\d{2})-(\d{2})T(\d{2}):(\d{2}):(\d{2}(?:\.\d*)?)((-(\d{2}):(\d{2})|Z)?)$"
+)
+_PATTERN = r"^[1-9][0-9]{3} ?(?!sa|sd|ss|SA|SD|SS)[A-Za-z]{2}$"
+_PATTERN_RE = re.compile(_PATTERN)
+
 
 class TestRandomString(unittest.TestCase):
     def test_default_min_max(self) -> None:
@@ -26,14 +34,31 @@ class TestRandomString(unittest.TestCase):
     def test_datetime(self) -> None:
         schema = {"format": "date-time"}
         value = value_utils.get_random_string(schema)
-        matcher = r"^(\d{4})-(\d{2})-(\d{2})T(\d{2}):(\d{2}):(\d{2}(?:\.\d*)?)((-(\d{2}):(\d{2})|Z)?)$"
-        self.assertRegex(value, matcher)
+        self.assertRegex(value, _DT_RE)
 
     def test_pattern(self) -> None:
-        pattern = r"^[1-9][0-9]{3} ?(?!sa|sd|ss|SA|SD|SS)[A-Za-z]{2}$"
+        schema = {"pattern": _PATTERN}
+        value = value_utils.get_random_string(schema)
+        self.assertRegex(value, _PATTERN_RE)
+
+    def test_pattern_without_lookarounds(self) -> None:
+        # patterns without lookarounds are served by the compiled emitter
+        pattern = r"^[1-9][0-9]{3} ?[A-Za-z]{2}$"
         schema = {"pattern": pattern}
+        for _ in range(10):
+            value = value_utils.get_random_string(schema)
+            self.assertRegex(value, pattern)
+
+    def test_pattern_parsing_is_cached(self) -> None:
+        # pylint: disable=protected-access
+        schema = {"pattern": _PATTERN}
+        value = value_utils.get_random_string(schema)
+        self.assertRegex(value, _PATTERN_RE)
+        hits_before = value_utils._parsed_pattern.cache_info().hits
         value = value_utils.get_random_string(schema)
-        self.assertRegex(value, pattern)
+        self.assertRegex(value, _PATTERN_RE)
+        hits_after = value_utils._parsed_pattern.cache_info().hits
+        self.assertGreater(hits_after, hits_before)
 
     def test_byte(self) -> None:
         schema = {"format": "byte"}
@@ -1,312 +1,150 @@
-# pylint: disable="missing-class-docstring", "missing-function-docstring"
-import unittest
+# pylint: disable="missing-function-docstring"
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Tuple
 
-from OpenApiLibCore import value_utils
-
-
-class TestValueOutOfBounds(unittest.TestCase):
-    def test_minimum_integer(self) -> None:
-        minimum = -42
-        value_schema = {"type": "integer", "minimum": minimum}
-        current_value = "irrelevant"
-        value = value_utils.get_value_out_of_bounds(
-            value_schema=value_schema,
-            current_value=current_value,
-        )
-        self.assertLess(value, minimum)
-        self.assertIsInstance(value, int)
-
-        minimum = 3
-        value_schema = {"type": "integer", "minimum": minimum}
-        current_value = "irrelevant"
-        value = value_utils.get_value_out_of_bounds(
-            value_schema=value_schema,
-            current_value=current_value,
-        )
-        self.assertLess(value, minimum)
-        self.assertIsInstance(value, int)
-
-    def test_minimum_number(self) -> None:
-        minimum = -0.6
-        value_schema = {"type": "integer", "minimum": minimum}
-        current_value = "irrelevant"
-        value = value_utils.get_value_out_of_bounds(
-            value_schema=value_schema,
-            current_value=current_value,
-        )
-        self.assertLess(value, minimum)
-        self.assertIsInstance(value, float)
-
-        minimum = 3.14159
-        value_schema = {"type": "integer", "minimum": minimum}
-        current_value = "irrelevant"
-        value = value_utils.get_value_out_of_bounds(
-            value_schema=value_schema,
-            current_value=current_value,
-        )
-        self.assertLess(value, minimum)
-        self.assertIsInstance(value, float)
-
-    def test_maximum_integer(self) -> None:
-        maximum = -42
-        value_schema = {"type": "integer", "maximum": maximum}
-        current_value = "irrelevant"
-        value = value_utils.get_value_out_of_bounds(
-            value_schema=value_schema,
-            current_value=current_value,
-        )
-        self.assertGreater(value, maximum)
-        self.assertIsInstance(value, int)
-
-        maximum = 3
-        value_schema = {"type": "integer", "maximum": maximum}
-        current_value = "irrelevant"
-        value = value_utils.get_value_out_of_bounds(
-            value_schema=value_schema,
-            current_value=current_value,
-        )
-        self.assertGreater(value, maximum)
-        self.assertIsInstance(value, int)
-
-    def test_maximum_number(self) -> None:
-        maximum = -0.6
-        value_schema = {"type": "integer", "maximum": maximum}
-        current_value = "irrelevant"
-        value = value_utils.get_value_out_of_bounds(
-            value_schema=value_schema,
-            current_value=current_value,
-        )
-        self.assertGreater(value, maximum)
-        self.assertIsInstance(value, float)
-
-        maximum = 3.14159
-        value_schema = {"type": "integer", "maximum": maximum}
-        current_value = "irrelevant"
-        value = value_utils.get_value_out_of_bounds(
-            value_schema=value_schema,
-            current_value=current_value,
-        )
-        self.assertGreater(value, maximum)
-        self.assertIsInstance(value, float)
-
-    def test_exclusive_minimum_integer_oas_3_0(self) -> None:
-        minimum = -42
-        value_schema = {"type": "integer", "minimum": minimum, "exclusiveMinimum": True}
-        current_value = "irrelevant"
-        value = value_utils.get_value_out_of_bounds(
-            value_schema=value_schema,
-            current_value=current_value,
-        )
-        self.assertEqual(value, minimum)
-        self.assertIsInstance(value, int)
-
-    def test_exclusive_minimum_integer_oas_3_1(self) -> None:
-        minimum = -42
-        value_schema = {"type": "integer", "exclusiveMinimum": minimum}
-        current_value = "irrelevant"
-        value = value_utils.get_value_out_of_bounds(
-            value_schema=value_schema,
-            current_value=current_value,
-        )
-        self.assertEqual(value, minimum)
-        self.assertIsInstance(value, int)
-
-    def test_exclusive_maximum_integer_oas_3_0(self) -> None:
-        maximum = -42
-        value_schema = {"type": "integer", "maximum": maximum, "exclusiveMaximum": True}
-        current_value = "irrelevant"
-        value = value_utils.get_value_out_of_bounds(
-            value_schema=value_schema,
-            current_value=current_value,
-        )
-        self.assertEqual(value, maximum)
-        self.assertIsInstance(value, int)
-
-    def test_exclusive_maximum_integer_oas_3_1(self) -> None:
-        maximum = -42
-        value_schema = {"type": "integer", "exclusiveMaximum": maximum}
-        current_value = "irrelevant"
-        value = value_utils.get_value_out_of_bounds(
-            value_schema=value_schema,
-            current_value=current_value,
-        )
-        self.assertEqual(value, maximum)
-        self.assertIsInstance(value, int)
-
-    def test_exclusive_minimum_number_oas_3_0(self) -> None:
-        minimum = 3.14159
-        value_schema = {"type": "integer", "minimum": minimum, "exclusiveMinimum": True}
-        current_value = "irrelevant"
-        value = value_utils.get_value_out_of_bounds(
-            value_schema=value_schema,
-            current_value=current_value,
-        )
-        self.assertEqual(value, minimum)
-        self.assertIsInstance(value, float)
-
-    def test_exclusive_minimum_number_oas_3_1(self) -> None:
-        minimum = 3.14159
-        value_schema = {"type": "integer", "exclusiveMinimum": minimum}
-        current_value = "irrelevant"
-        value = value_utils.get_value_out_of_bounds(
-            value_schema=value_schema,
-            current_value=current_value,
-        )
-        self.assertEqual(value, minimum)
-        self.assertIsInstance(value, float)
-
-    def test_exclusive_maximum_number_oas_3_0(self) -> None:
-        maximum = -273.15
-        value_schema = {"type": "integer", "maximum": maximum, "exclusiveMaximum": True}
-        current_value = "irrelevant"
-        value = value_utils.get_value_out_of_bounds(
-            value_schema=value_schema,
-            current_value=current_value,
-        )
-        self.assertEqual(value, maximum)
-        self.assertIsInstance(value, float)
-
-    def test_exclusive_maximum_number_oas_3_1(self) -> None:
-        maximum = -273.15
-        value_schema = {"type": "integer", "exclusiveMaximum": maximum}
-        current_value = "irrelevant"
-        value = value_utils.get_value_out_of_bounds(
-            value_schema=value_schema,
-            current_value=current_value,
-        )
-        self.assertEqual(value, maximum)
-        self.assertIsInstance(value, float)
-
-    def test_minimum_length(self) -> None:
-        minimum = 1
-        value_schema = {"type": "string", "minLength": minimum}
-        current_value = "irrelevant"
-        value = value_utils.get_value_out_of_bounds(
-            value_schema=value_schema,
-            current_value=current_value,
-        )
-        self.assertLess(len(value), minimum)
-        self.assertIsInstance(value, str)
-
-    def test_maximum_length(self) -> None:
-        maximum = 7
-        value_schema = {"type": "string", "maxLength": maximum}
-        current_value = "valid"
-        value = value_utils.get_value_out_of_bounds(
-            value_schema=value_schema,
-            current_value=current_value,
-        )
-        self.assertGreater(len(value), maximum)
-        self.assertIsInstance(value, str)
-
-        maximum = 7
-        value_schema = {"type": "string", "maxLength": maximum}
-        current_value = ""
-        value = value_utils.get_value_out_of_bounds(
-            value_schema=value_schema,
-            current_value=current_value,
-        )
-        self.assertGreater(len(value), maximum)
-        self.assertIsInstance(value, str)
-
-    def test_minimum_length_zero(self) -> None:
-        minimum = 0
-        value_schema = {"type": "string", "minLength": minimum}
-        current_value = "irrelevant"
-        value = value_utils.get_value_out_of_bounds(
-            value_schema=value_schema,
-            current_value=current_value,
-        )
-        self.assertEqual(value, None)
-
-    def test_maximum_length_zero(self) -> None:
-        maximum = 0
-        value_schema = {"type": "string", "maxLength": maximum}
-        current_value = "irrelevant"
-        value = value_utils.get_value_out_of_bounds(
-            value_schema=value_schema,
-            current_value=current_value,
-        )
-        self.assertEqual(value, None)
-
-    def test_min_items(self) -> None:
-        minimum = 1
-        value_schema = {
-            "type": "array",
-            "minItems": minimum,
-            "items": {"type": "string"},
-        }
-        current_value = ["irrelevant"]
-        value = value_utils.get_value_out_of_bounds(
-            value_schema=value_schema,
-            current_value=current_value,
-        )
-        self.assertLess(len(value), minimum)
-        self.assertIsInstance(value, list)
-
-    def test_max_items(self) -> None:
-        maximum = 3
-        value_schema = {
-            "type": "array",
-            "maxItems": maximum,
-            "items": {"type": "boolean"},
-        }
-        current_value = [True, False]
-        value = value_utils.get_value_out_of_bounds(
-            value_schema=value_schema,
-            current_value=current_value,
-        )
-        self.assertGreater(len(value), maximum)
-        self.assertIsInstance(value, list)
-
-    def test_min_items_zero(self) -> None:
-        minimum = 0
-        value_schema = {
-            "type": "array",
-            "minItems": minimum,
-            "items": {"type": "number"},
-        }
-        current_value = [42]
-        value = value_utils.get_value_out_of_bounds(
-            value_schema=value_schema,
-            current_value=current_value,
-        )
-        self.assertEqual(value, None)
-
-    def test_unbound(self) -> None:
-        value_schema = {"type": "integer"}
-        current_value = "irrelvant"
-        value = value_utils.get_value_out_of_bounds(
-            value_schema=value_schema,
-            current_value=current_value,
-        )
-        self.assertEqual(value, None)
-
-        value_schema = {"type": "number"}
-        current_value = "irrelvant"
-        value = value_utils.get_value_out_of_bounds(
-            value_schema=value_schema,
-            current_value=current_value,
-        )
-        self.assertEqual(value, None)
-
-        value_schema = {"type": "string"}
-        current_value = "irrelvant"
-        value = value_utils.get_value_out_of_bounds(
-            value_schema=value_schema,
-            current_value=current_value,
-        )
-        self.assertEqual(value, None)
-
-    def test_unsupported(self) -> None:
-        value_schema = {"type": "boolean"}
-        current_value = "irrelevant"
-        value = value_utils.get_value_out_of_bounds(
-            value_schema=value_schema,
-            current_value=current_value,
-        )
-        self.assertEqual(value, None)
+import pytest
 
+from OpenApiLibCore import value_utils
 
-if __name__ == "__main__":
-    unittest.main()
+Schema = Mapping[str, Any]
+
+# prototypes for the schema factory below
+_INT: Dict[str, Any] = {"type": "integer"}
+_STR: Dict[str, Any] = {"type": "string"}
+_STR_ARR: Dict[str, Any] = {"type": "array", "items": {"type": "string"}}
+_BOOL_ARR: Dict[str, Any] = {"type": "array", "items": {"type": "boolean"}}
+_NUM_ARR: Dict[str, Any] = {"type": "array", "items": {"type": "number"}}
+
+
+def _schema(base: Dict[str, Any], **overrides: Any) -> Schema:
+    """Copy the prototype and apply the overrides; a C-level dict copy is
+    cheaper than re-parsing a dict literal per case."""
+    schema = base.copy()
+    schema.update(overrides)
+    # the result is shared across parametrized invocations, so freeze it
+    return MappingProxyType(schema)
+
+
+MINIMUM_CASES: List[Tuple[Schema, Any, type]] = [
+    (_schema(_INT, minimum=-42), -42, int),
+    (_schema(_INT, minimum=3), 3, int),
+    (_schema(_INT, minimum=-0.6), -0.6, float),
+    (_schema(_INT, minimum=3.14159), 3.14159, float),
+]
+
+MAXIMUM_CASES: List[Tuple[Schema, Any, type]] = [
+    (_schema(_INT, maximum=-42), -42, int),
+    (_schema(_INT, maximum=3), 3, int),
+    (_schema(_INT, maximum=-0.6), -0.6, float),
+    (_schema(_INT, maximum=3.14159), 3.14159, float),
+]
+
+# both the OAS 3.0 (boolean) and OAS 3.1 (numeric) exclusive bound styles
+EXCLUSIVE_BOUND_CASES: List[Tuple[Schema, Any, type]] = [
+    (_schema(_INT, minimum=-42, exclusiveMinimum=True), -42, int),
+    (_schema(_INT, exclusiveMinimum=-42), -42, int),
+    (_schema(_INT, maximum=-42, exclusiveMaximum=True), -42, int),
+    (_schema(_INT, exclusiveMaximum=-42), -42, int),
+    (_schema(_INT, minimum=3.14159, exclusiveMinimum=True), 3.14159, float),
+    (_schema(_INT, exclusiveMinimum=3.14159), 3.14159, float),
+    (_schema(_INT, maximum=-273.15, exclusiveMaximum=True), -273.15, float),
+    (_schema(_INT, exclusiveMaximum=-273.15), -273.15, float),
+]
+
+_MIN_LENGTH_SCHEMA = _schema(_STR, minLength=1)
+_MAX_LENGTH_SCHEMA = _schema(_STR, maxLength=7)
+_MIN_ITEMS_SCHEMA = _schema(_STR_ARR, minItems=1)
+_MAX_ITEMS_SCHEMA = _schema(_BOOL_ARR, maxItems=3)
+
+MAXIMUM_LENGTH_CASES: List[Tuple[Schema, str]] = [
+    (_MAX_LENGTH_SCHEMA, "valid"),
+    (_MAX_LENGTH_SCHEMA, ""),
+]
+
+# bounds of 0 cannot be violated, unbound and boolean schemas have no bounds
+NONE_CASES: List[Tuple[Schema, Any]] = [
+    (_schema(_STR, minLength=0), "irrelevant"),
+    (_schema(_STR, maxLength=0), "irrelevant"),
+    (_schema(_NUM_ARR, minItems=0), [42]),
+    (_schema(_INT), "irrelevant"),
+    (MappingProxyType({"type": "number"}), "irrelevant"),
+    (_schema(_STR), "irrelevant"),
+    (MappingProxyType({"type": "boolean"}), "irrelevant"),
+]
+
+
+@pytest.mark.parametrize("value_schema, minimum, expected_type", MINIMUM_CASES)
+def test_minimum(value_schema: Schema, minimum: Any, expected_type: type) -> None:
+    value = value_utils.get_value_out_of_bounds(
+        value_schema=value_schema,
+        current_value="irrelevant",
+    )
+    assert value < minimum
+    assert isinstance(value, expected_type)
+
+
+@pytest.mark.parametrize("value_schema, maximum, expected_type", MAXIMUM_CASES)
+def test_maximum(value_schema: Schema, maximum: Any, expected_type: type) -> None:
+    value = value_utils.get_value_out_of_bounds(
+        value_schema=value_schema,
+        current_value="irrelevant",
+    )
+    assert value > maximum
+    assert isinstance(value, expected_type)
+
+
+@pytest.mark.parametrize("value_schema, bound, expected_type", EXCLUSIVE_BOUND_CASES)
+def test_exclusive_bound(value_schema: Schema, bound: Any, expected_type: type) -> None:
+    # the bound itself is out of bounds when the bound is exclusive
+    value = value_utils.get_value_out_of_bounds(
+        value_schema=value_schema,
+        current_value="irrelevant",
+    )
+    assert value == bound
+    assert isinstance(value, expected_type)
+
+
+def test_minimum_length() -> None:
+    value = value_utils.get_value_out_of_bounds(
+        value_schema=_MIN_LENGTH_SCHEMA,
+        current_value="irrelevant",
+    )
+    assert len(value) < _MIN_LENGTH_SCHEMA["minLength"]
+    assert isinstance(value, str)
+
+
+@pytest.mark.parametrize("value_schema, current_value", MAXIMUM_LENGTH_CASES)
+def test_maximum_length(value_schema: Schema, current_value: str) -> None:
+    value = value_utils.get_value_out_of_bounds(
+        value_schema=value_schema,
+        current_value=current_value,
+    )
+    assert len(value) > value_schema["maxLength"]
+    assert isinstance(value, str)
+
+
+def test_min_items() -> None:
+    value = value_utils.get_value_out_of_bounds(
+        value_schema=_MIN_ITEMS_SCHEMA,
+        current_value=["irrelevant"],
+    )
+    assert len(value) < _MIN_ITEMS_SCHEMA["minItems"]
+    assert isinstance(value, list)
+
+
+def test_max_items() -> None:
+    value = value_utils.get_value_out_of_bounds(
+        value_schema=_MAX_ITEMS_SCHEMA,
+        current_value=[True, False],
+    )
+    assert len(value) > _MAX_ITEMS_SCHEMA["maxItems"]
+    assert isinstance(value, list)
+
+
+@pytest.mark.parametrize("value_schema, current_value", NONE_CASES)
+def test_returns_none(value_schema: Schema, current_value: Any) -> None:
+    value = value_utils.get_value_out_of_bounds(
+        value_schema=value_schema,
+        current_value=current_value,
+    )
+    assert value is None
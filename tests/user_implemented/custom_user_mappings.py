@@ -1,4 +1,8 @@
 # pylint: disable=invalid-name
+# NOTE: this module must stay self-contained: the library imports it by module
+# name with only this folder on sys.path, so it cannot import from the tests
+# package. The Dtos here also deliberately differ from tests/variables.py
+# (property names and error codes match the testserver API).
 from typing import Dict, List, Tuple, Type
 
 from OpenApiLibCore import (
@@ -12,99 +16,110 @@ from OpenApiLibCore import (
     UniquePropertyValueConstraint,
 )
 
+# shared, immutable constraint values
+_HOURLY_RATES = (80.99, 90.99, 99.99)
+_DATES_OF_BIRTH = ("1970-07-07", "1980-08-08", "1990-09-09")
+
+# The relations are built once at import time as immutable tuples; the
+# get_relations implementations only have to wrap them in a fresh list.
+_WAGEGROUP_RELATIONS: Tuple[Relation, ...] = (
+    UniquePropertyValueConstraint(
+        property_name="id",
+        value="Teapot",
+        error_code=418,
+    ),
+    IdReference(
+        property_name="wagegroup_id",
+        post_path="/employees",
+        error_code=406,
+    ),
+    PropertyValueConstraint(
+        property_name="overtime_percentage",
+        values=[IGNORE],
+        invalid_value=110,
+        invalid_value_error_code=422,
+    ),
+    PropertyValueConstraint(
+        property_name="hourly-rate",
+        values=_HOURLY_RATES,
+        error_code=400,
+    ),
+)
+
+_WAGEGROUP_DELETE_RELATIONS: Tuple[Relation, ...] = (
+    UniquePropertyValueConstraint(
+        property_name="id",
+        value="Teapot",
+        error_code=418,
+    ),
+    IdReference(
+        property_name="wagegroup_id",
+        post_path="/employees",
+        error_code=406,
+    ),
+)
+
+_EMPLOYEE_RELATIONS: Tuple[Relation, ...] = (
+    IdDependency(
+        property_name="wagegroup_id",
+        get_path="/wagegroups",
+        error_code=451,
+    ),
+    PropertyValueConstraint(
+        property_name="date_of_birth",
+        values=_DATES_OF_BIRTH,
+        invalid_value="2020-02-20",
+        invalid_value_error_code=403,
+        error_code=422,
+    ),
+)
+
+_ENERGY_LABEL_RELATIONS: Tuple[Relation, ...] = (
+    PathPropertiesConstraint(path="/energy_label/1111AA/10"),
+)
+
+_MESSAGE_PARAMETER_RELATIONS: Tuple[Relation, ...] = (
+    PropertyValueConstraint(
+        property_name="secret-code",  # note: property name converted by FastAPI
+        values=[42],
+        error_code=401,
+    ),
+    PropertyValueConstraint(
+        property_name="seal",
+        values=[IGNORE],
+        error_code=403,
+    ),
+)
+
 
 class WagegroupDto(Dto):
     @staticmethod
     def get_relations() -> List[Relation]:
-        relations: List[Relation] = [
-            UniquePropertyValueConstraint(
-                property_name="id",
-                value="Teapot",
-                error_code=418,
-            ),
-            IdReference(
-                property_name="wagegroup_id",
-                post_path="/employees",
-                error_code=406,
-            ),
-            PropertyValueConstraint(
-                property_name="overtime_percentage",
-                values=[IGNORE],
-                invalid_value=110,
-                invalid_value_error_code=422,
-            ),
-            PropertyValueConstraint(
-                property_name="hourly-rate",
-                values=[80.99, 90.99, 99.99],
-                error_code=400,
-            ),
-        ]
-        return relations
+        return list(_WAGEGROUP_RELATIONS)
 
 
 class WagegroupDeleteDto(Dto):
     @staticmethod
     def get_relations() -> List[Relation]:
-        relations: List[Relation] = [
-            UniquePropertyValueConstraint(
-                property_name="id",
-                value="Teapot",
-                error_code=418,
-            ),
-            IdReference(
-                property_name="wagegroup_id",
-                post_path="/employees",
-                error_code=406,
-            ),
-        ]
-        return relations
+        return list(_WAGEGROUP_DELETE_RELATIONS)
 
 
 class EmployeeDto(Dto):
     @staticmethod
     def get_relations() -> List[Relation]:
-        relations: List[Relation] = [
-            IdDependency(
-                property_name="wagegroup_id",
-                get_path="/wagegroups",
-                error_code=451,
-            ),
-            PropertyValueConstraint(
-                property_name="date_of_birth",
-                values=["1970-07-07", "1980-08-08", "1990-09-09"],
-                invalid_value="2020-02-20",
-                invalid_value_error_code=403,
-                error_code=422,
-            ),
-        ]
-        return relations
+        return list(_EMPLOYEE_RELATIONS)
 
 
 class EnergyLabelDto(Dto):
     @staticmethod
     def get_relations() -> List[Relation]:
-        relations: List[Relation] = [
-            PathPropertiesConstraint(path="/energy_label/1111AA/10"),
-        ]
-        return relations
+        return list(_ENERGY_LABEL_RELATIONS)
 
 
 class MessageDto(Dto):
     @staticmethod
     def get_parameter_relations() -> List[Relation]:
-        relations: List[Relation] = [
-            PropertyValueConstraint(
-                property_name="secret-code",  # note: property name converted by FastAPI
-                values=[42],
-                error_code=401,
-            ),
-            PropertyValueConstraint(
-                property_name="seal",
-                values=[IGNORE],
-                error_code=403,
-            ),
-        ]
-        return relations
+        return list(_MESSAGE_PARAMETER_RELATIONS)
 
 
 DTO_MAPPING: Dict[Tuple[str, str], Type[Dto]] = {